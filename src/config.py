@@ -1,12 +1,51 @@
 """Configuration management for Proxmox ISO builder."""
 
-import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
+try:
+    # Optional: SIMD-accelerated JSON parsing; the stdlib parser is the
+    # drop-in fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# Shared on-disk artifact cache (ISOs, extracted trees, firmware debs),
+# reused across builds and work directories
+CACHE_DIR = Path(
+    os.environ.get("PROXMOX_ISO_CACHE", "~/.cache/proxmox-iso")
+).expanduser()
+
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _to_bool(value: str) -> bool:
+    """Convert an environment-variable string to a boolean."""
+    return value.lower() in _TRUTHY
+
+
+def _to_arch_list(value: str) -> List[str]:
+    """Split a comma-separated architecture list."""
+    return [arch.strip() for arch in value.split(",")]
+
+
+# Environment variable, config attribute, and value converter — built
+# once at import so load_from_env is a single pass with no per-key type
+# dispatch
+_ENV_SPEC = (
+    ("PROXMOX_VERSION", "proxmox_version", str),
+    ("DEBIAN_RELEASE", "debian_release", str),
+    ("INCLUDE_NVIDIA", "include_nvidia", _to_bool),
+    ("INCLUDE_AMD", "include_amd", _to_bool),
+    ("INCLUDE_INTEL", "include_intel", _to_bool),
+    ("BOOT_MODE", "boot_mode", str),
+    ("BUILD_ARCH", "build_arch", _to_arch_list),
+    ("OUTPUT_DIR", "output_dir", Path),
+    ("WORK_DIR", "work_dir", Path),
+    ("FIRMWARE_CACHE", "firmware_cache", Path),
+)
 
 
 @dataclass
@@ -18,6 +57,9 @@ class BuildConfig:
     include_nvidia: bool = True
     include_amd: bool = True
     include_intel: bool = True
+    # Boot support to build into the ISO: "bios", "uefi" or "hybrid".
+    # UEFI-only ISOs skip the isolinux/Joliet machinery entirely.
+    boot_mode: str = "hybrid"
     build_arch: Optional[List[str]] = None
     output_dir: Path = Path("output")
     work_dir: Path = Path("work")
@@ -46,11 +88,15 @@ class ConfigManager:
         """
         self.config_file = config_file
         self.config = BuildConfig()
+        self._loaded_file: Optional[Path] = None
 
     def load_from_file(self, file_path: Path) -> None:
         """
         Load configuration from YAML or JSON file.
 
+        Loading the same file twice is a no-op, so callers don't parse
+        the configuration more than once per run.
+
         Args:
             file_path: Path to configuration file
 
@@ -58,6 +104,9 @@ class ConfigManager:
             ValueError: If file format is not supported
             FileNotFoundError: If configuration file doesn't exist
         """
+        if self._loaded_file == file_path:
+            return
+
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
@@ -65,41 +114,36 @@ class ConfigManager:
         content = file_path.read_text()
 
         if suffix in [".yaml", ".yml"]:
-            data = yaml.safe_load(content)
+            # Deferred: PyYAML costs tens of milliseconds to import, paid
+            # at every CLI start if hoisted, but only YAML configs need it.
+            # The libyaml-backed CSafeLoader parses several times faster
+            # than the pure-Python SafeLoader that safe_load defaults to
+            import yaml
+
+            try:
+                from yaml import CSafeLoader as _SafeLoader
+            except ImportError:
+                from yaml import SafeLoader as _SafeLoader
+
+            data = yaml.load(content, Loader=_SafeLoader)
         elif suffix == ".json":
-            data = json.loads(content)
+            data = _json_loads(content)
         else:
             raise ValueError(f"Unsupported configuration format: {suffix}")
 
         self._update_config(data)
+        self._loaded_file = file_path
 
     def load_from_env(self) -> None:
         """Load configuration from environment variables."""
-        env_mapping = {
-            "PROXMOX_VERSION": "proxmox_version",
-            "DEBIAN_RELEASE": "debian_release",
-            "INCLUDE_NVIDIA": "include_nvidia",
-            "INCLUDE_AMD": "include_amd",
-            "INCLUDE_INTEL": "include_intel",
-            "BUILD_ARCH": "build_arch",
-            "OUTPUT_DIR": "output_dir",
-            "WORK_DIR": "work_dir",
-            "FIRMWARE_CACHE": "firmware_cache",
-        }
-
         data: Dict[str, Any] = {}
-        for env_var, config_key in env_mapping.items():
-            value = os.getenv(env_var)
+        # One bound lookup into the environ mapping per key; os.getenv
+        # re-resolves the _Environ proxy attribute on every call
+        env_get = os.environ.get
+        for env_var, config_key, converter in _ENV_SPEC:
+            value = env_get(env_var)
             if value is not None:
-                # Convert string to appropriate type
-                if config_key in ["include_nvidia", "include_amd", "include_intel"]:
-                    data[config_key] = value.lower() in ["true", "1", "yes"]
-                elif config_key == "build_arch":
-                    data[config_key] = [arch.strip() for arch in value.split(",")]
-                elif config_key in ["output_dir", "work_dir", "firmware_cache"]:
-                    data[config_key] = Path(value)
-                else:
-                    data[config_key] = value
+                data[config_key] = converter(value)
 
         self._update_config(data)
 
@@ -139,6 +183,12 @@ class ConfigManager:
         if not self.config.debian_release:
             raise ValueError("Debian release must be specified")
 
+        if self.config.boot_mode not in ("bios", "uefi", "hybrid"):
+            raise ValueError(
+                f"Invalid boot mode: {self.config.boot_mode} "
+                "(expected 'bios', 'uefi' or 'hybrid')"
+            )
+
         if not self.config.build_arch:
             raise ValueError("At least one build architecture must be specified")
 
@@ -1,19 +1,152 @@
 """Firmware integration module for Proxmox ISO builder."""
 
+import functools
 import hashlib
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import requests
+
+from src.config import CACHE_DIR, BuildConfig
 from src.performance import track_performance
 
+try:
+    # Optional: SIMD-accelerated JSON parsing; the stdlib parser is the
+    # drop-in fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+try:
+    from debian import debfile
+except ImportError:  # pragma: no cover - python-debian is a declared dep
+    debfile = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Firmware .debs shared across builds and firmware cache directories
+SHARED_DEB_CACHE = CACHE_DIR / "debs"
+
+
+def _run_quiet(cmd: List[str], **kwargs: Any) -> "subprocess.CompletedProcess":
+    """
+    Run a subprocess discarding stdout, keeping stderr for diagnostics.
+
+    Avoids the pipe allocation and drain that capture_output=True pays
+    for stdout nobody reads; e.stderr remains available in
+    CalledProcessError handlers.
+
+    Args:
+        cmd: Command and arguments
+        **kwargs: Passed through to subprocess.run
+
+    Returns:
+        CompletedProcess from subprocess.run
+
+    Raises:
+        subprocess.CalledProcessError: On a non-zero exit status
+    """
+    return subprocess.run(
+        cmd,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        **kwargs,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _deb_pattern(package_name: str) -> "re.Pattern[str]":
+    """
+    Compiled filename pattern for a package's cached .debs.
+
+    Path.glob re-translates its pattern to a regex on every call; this
+    compiles once per package name for the life of the process.
+
+    Args:
+        package_name: Debian package name
+
+    Returns:
+        Pattern matching the name_version_arch.deb convention
+    """
+    return re.compile(re.escape(package_name) + r"_.*\.deb$")
+
+
+@functools.lru_cache(maxsize=1)
+def _firmware_sources(sources_path: str) -> Dict[str, List[str]]:
+    """
+    Load the vendor-to-packages mapping, parsed once per process.
+
+    Repeat FirmwareManager constructions (e.g. a loop over target
+    architectures) share the parse result instead of re-reading and
+    re-tokenizing the JSON each time. Callers must not mutate the
+    returned mapping.
+
+    Args:
+        sources_path: Path to the firmware sources JSON file
+
+    Returns:
+        Dictionary mapping vendor to list of package names
+    """
+    sources_file = Path(sources_path)
+    if sources_file.exists():
+        # Bytes in, parsed mapping out; orjson takes bytes natively and
+        # the stdlib fallback accepts them too
+        sources: Dict[str, List[str]] = _json_loads(sources_file.read_bytes())
+        return sources
+
+    # Default firmware sources (matches config/firmware-sources.json)
+    return {
+        "freeware": [
+            "firmware-linux-free",
+            "firmware-misc-nonfree",
+            "firmware-linux-nonfree",
+        ],
+        "nvidia": [
+            "nvidia-driver",
+            "nvidia-kernel-dkms",
+            "firmware-nvidia-graphics",
+        ],
+        "amd": [
+            "firmware-amd-graphics",
+            "amd64-microcode",
+        ],
+        "intel": [
+            "intel-microcode",
+            "firmware-intel-sound",
+            "firmware-intel-graphics",
+            "firmware-intel-misc",
+        ],
+    }
+
+
+def _link_or_copy(src: "Union[str, Path]", dest: "Union[str, Path]") -> None:
+    """
+    Hardlink a file into place, copying when crossing filesystems.
+
+    Args:
+        src: Source file
+        dest: Destination path
+    """
+    try:
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
 
 @dataclass
 class FirmwarePackage:
@@ -51,22 +184,48 @@ class FirmwareManager:
     DEBIAN_REPO_BASE = "http://deb.debian.org/debian"
     FIRMWARE_SOURCES_FILE = "config/firmware-sources.json"
 
-    def __init__(self, cache_dir: Path, debian_release: str = "trixie") -> None:
+    # Which build-config flag gates each optional vendor; freeware has
+    # no flag and is always fetched
+    VENDOR_FLAGS = {
+        "nvidia": "include_nvidia",
+        "amd": "include_amd",
+        "intel": "include_intel",
+    }
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        debian_release: str = "trixie",
+        config: Optional[BuildConfig] = None,
+    ) -> None:
         """
         Initialize firmware manager.
 
         Args:
             cache_dir: Directory for caching firmware packages
             debian_release: Debian release name (default: trixie)
+            config: Optional build configuration; when given, vendors
+                deselected in it are skipped without any apt traffic
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.debian_release = debian_release
-        self.firmware_sources = self._load_firmware_sources()
+        self.config = config
+        self.firmware_sources = _firmware_sources(self.FIRMWARE_SOURCES_FILE)
         self._sources_configured = False
+        self._sources_lock = threading.Lock()
+        self._hash_cache_path = self.cache_dir / ".hashes.json"
+        self._hash_cache = self._load_hash_cache()
+        self._hash_lock = threading.Lock()
 
     def _configure_apt_sources(self) -> None:
         """Configure apt sources for the target Debian release with non-free."""
+        # Serialize: vendor downloads may run concurrently
+        with self._sources_lock:
+            self._configure_apt_sources_locked()
+
+    def _configure_apt_sources_locked(self) -> None:
+        """Configure apt sources while holding the sources lock."""
         if self._sources_configured:
             return
 
@@ -92,62 +251,20 @@ class FirmwareManager:
 
         try:
             # Write sources file (use sudo for permission)
-            subprocess.run(
+            _run_quiet(
                 ["sudo", "tee", str(sources_file)],
-                input=sources_content.encode(),
-                check=True,
-                capture_output=True,
+                input=sources_content,
             )
 
             # Update apt cache (use sudo for permission)
             logger.info("Updating apt cache...")
-            subprocess.run(
-                ["sudo", "apt-get", "update"],
-                check=True,
-                capture_output=True,
-            )
+            _run_quiet(["sudo", "apt-get", "update"])
             self._sources_configured = True
             logger.info("Apt sources configured successfully")
         except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to configure apt sources: {e.stderr}")
             # Continue anyway - some packages may still be available
 
-    def _load_firmware_sources(self) -> Dict[str, List[str]]:
-        """
-        Load firmware sources from configuration file.
-
-        Returns:
-            Dictionary mapping vendor to list of package names
-        """
-        sources_file = Path(self.FIRMWARE_SOURCES_FILE)
-        if sources_file.exists():
-            with sources_file.open() as f:
-                return json.load(f)
-
-        # Default firmware sources (matches config/firmware-sources.json)
-        return {
-            "freeware": [
-                "firmware-linux-free",
-                "firmware-misc-nonfree",
-                "firmware-linux-nonfree",
-            ],
-            "nvidia": [
-                "nvidia-driver",
-                "nvidia-kernel-dkms",
-                "firmware-nvidia-graphics",
-            ],
-            "amd": [
-                "firmware-amd-graphics",
-                "amd64-microcode",
-            ],
-            "intel": [
-                "intel-microcode",
-                "firmware-intel-sound",
-                "firmware-intel-graphics",
-                "firmware-intel-misc",
-            ],
-        }
-
     def _validate_package_exists(self, package_name: str) -> bool:
         """
         Check if a package exists in the configured apt repositories.
@@ -161,7 +278,8 @@ class FirmwareManager:
         try:
             result = subprocess.run(
                 ["apt-cache", "show", package_name],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
             return result.returncode == 0
@@ -169,6 +287,54 @@ class FirmwareManager:
             logger.warning("apt-cache not found, skipping package validation")
             return True  # Assume exists if can't check
 
+    def _validate_packages(self, packages: List[str]) -> List[str]:
+        """
+        Filter a package list down to the names apt knows about.
+
+        Validation round-trips are independent, so they overlap on a
+        thread pool. An empty list (a vendor with no packages in a
+        user-supplied sources file) yields an empty result without
+        creating a pool.
+
+        Args:
+            packages: Package names to validate
+
+        Returns:
+            Names of the packages found in the repositories
+        """
+        if not packages:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+            validity = executor.map(self._validate_package_exists, packages)
+
+        available = []
+        for package_name, valid in zip(packages, validity):
+            if valid:
+                available.append(package_name)
+            else:
+                logger.warning(
+                    f"Package '{package_name}' not found in repositories, " "skipping"
+                )
+        return available
+
+    def _vendor_disabled(self, vendor: str) -> bool:
+        """
+        Check whether the build configuration deselects a vendor.
+
+        Args:
+            vendor: Hardware vendor name
+
+        Returns:
+            True if a config is attached and its vendor flag is off
+        """
+        flag = self.VENDOR_FLAGS.get(vendor)
+        return (
+            flag is not None
+            and self.config is not None
+            and not getattr(self.config, flag)
+        )
+
     def download_firmware(self, vendor: str, force: bool = False) -> List[Path]:
         """
         Download firmware packages for specified vendor.
@@ -186,6 +352,12 @@ class FirmwareManager:
         with track_performance(
             f"download_{vendor}_packages", stage="firmware_download"
         ):
+            # Deselected vendors cost nothing: no apt sources setup, no
+            # validation round-trips, no downloads
+            if self._vendor_disabled(vendor):
+                logger.debug(f"{vendor} firmware disabled in config, skipping")
+                return []
+
             # Configure apt sources before downloading
             self._configure_apt_sources()
 
@@ -197,22 +369,33 @@ class FirmwareManager:
 
             logger.info(f"Downloading {vendor} firmware packages: {packages}")
 
-            for package_name in packages:
-                # Validate package exists before attempting download
-                if not self._validate_package_exists(package_name):
-                    logger.warning(
-                        f"Package '{package_name}' not found in repositories, skipping"
-                    )
-                    continue
-
-                try:
-                    file_path = self._download_package(package_name, force)
-                    if file_path:
-                        downloaded_files.append(file_path)
-                        logger.info(f"Downloaded: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to download {package_name}: {e}")
-                    # Continue with other packages
+            available = self._validate_packages(packages)
+
+            # Satisfy what we can from the caches, then fetch the rest
+            # with a single batched apt-get invocation: apt re-parses its
+            # sources and rebuilds its cache on every fork, so one launch
+            # for N packages beats N launches
+            to_fetch: List[str] = []
+            for package_name in available:
+                cached = None if force else self._cached_package(package_name)
+                if cached:
+                    downloaded_files.append(cached)
+                else:
+                    to_fetch.append(package_name)
+
+            if to_fetch:
+                # Scan the cache even when the batch exits non-zero: one
+                # unknown package fails the whole apt-get invocation, but
+                # the .debs fetched before the error are still usable
+                self._batch_download(to_fetch)
+                for package_name in to_fetch:
+                    deb_file = self._find_cached_deb(self.cache_dir, package_name)
+                    if deb_file:
+                        self._seed_shared_cache(deb_file)
+                        downloaded_files.append(deb_file)
+                        logger.info(f"Downloaded: {deb_file}")
+                    else:
+                        logger.warning(f"Failed to download {package_name}")
 
             if not downloaded_files:
                 raise FirmwareDownloadError(
@@ -221,56 +404,186 @@ class FirmwareManager:
 
             return downloaded_files
 
-    def _download_package(
-        self, package_name: str, force: bool = False
-    ) -> Optional[Path]:
+    def _cached_package(self, package_name: str) -> Optional[Path]:
         """
-        Download a single Debian package.
+        Look up a package in the build-local and shared caches.
 
         Args:
             package_name: Name of the Debian package
-            force: Force re-download even if cached
 
         Returns:
-            Path to downloaded package or None if already cached
+            Path to a cached package, or None on a cache miss
         """
-        cache_file = self.cache_dir / f"{package_name}.deb"
+        # Build-local cache first, then the cross-build shared cache
+        cached = self._find_cached_deb(self.cache_dir, package_name)
+        if cached:
+            logger.debug(f"Using cached package: {cached}")
+            return cached
+
+        shared = self._find_cached_deb(SHARED_DEB_CACHE, package_name)
+        if shared:
+            logger.debug(f"Using shared cached package: {shared}")
+            local_copy = self.cache_dir / shared.name
+            _link_or_copy(shared, local_copy)
+            return local_copy
+
+        return None
 
-        if cache_file.exists() and not force:
-            logger.debug(f"Using cached package: {cache_file}")
-            return cache_file
+    def _batch_download(self, package_names: List[str]) -> bool:
+        """
+        Download several Debian packages with one apt-get invocation.
 
-        # Use apt-get download with proper environment
+        Args:
+            package_names: Names of the packages to download
+
+        Returns:
+            True if apt-get ran, False if it is unavailable or failed
+        """
         env = os.environ.copy()
         env["DEBIAN_FRONTEND"] = "noninteractive"
 
         try:
-            subprocess.run(
+            _run_quiet(
                 [
                     "apt-get",
                     "download",
-                    package_name,
+                    "-t",
+                    self.debian_release,
+                    *package_names,
                 ],
                 cwd=self.cache_dir,
-                check=True,
-                capture_output=True,
                 env=env,
             )
-
-            # Find the downloaded .deb file
-            deb_files = list(self.cache_dir.glob(f"{package_name}*.deb"))
-            if deb_files:
-                return deb_files[0]
-
+            return True
         except subprocess.CalledProcessError as e:
-            logger.error(f"apt-get download failed for {package_name}: {e.stderr}")
+            logger.error(f"apt-get download failed: {e.stderr}")
         except FileNotFoundError:
             logger.error(
                 "apt-get not found. Ensure Debian/Ubuntu environment "
                 "or run within Docker container"
             )
+        return False
 
-        return None
+    def download_package(
+        self, package: FirmwarePackage, force: bool = False
+    ) -> Optional[Path]:
+        """
+        Fetch a firmware package from its direct URL.
+
+        Covers FirmwarePackage entries that point at a mirror URL rather
+        than an apt repository. The transfer is resumable, and the
+        package checksum is verified when one is declared.
+
+        Args:
+            package: Package description with a download URL
+            force: Force re-download even if cached
+
+        Returns:
+            Path to the package, or None if the download failed
+
+        Raises:
+            FirmwareDownloadError: If the downloaded file fails its
+                checksum check
+        """
+        if not force:
+            cached = self._cached_package(package.name)
+            if cached:
+                return cached
+
+        dest = self.cache_dir / package.url.rsplit("/", 1)[-1]
+        if not self._download_package_http(package.url, dest):
+            return None
+
+        if package.checksum and not self.verify_checksum(
+            dest, package.checksum, package.checksum_type
+        ):
+            dest.unlink(missing_ok=True)
+            raise FirmwareDownloadError(
+                f"Checksum mismatch for {package.name} from {package.url}"
+            )
+
+        self._seed_shared_cache(dest)
+        return dest
+
+    def _download_package_http(self, url: str, dest: Path) -> bool:
+        """
+        Stream a URL to a local file with resume support.
+
+        Downloads into a ``.part`` sidecar in 1 MiB chunks and renames it
+        into place on success; an interrupted transfer resumes from where
+        it left off via an HTTP Range request instead of restarting.
+
+        Args:
+            url: Package download URL
+            dest: Final destination path
+
+        Returns:
+            True on success, False if the download failed
+        """
+        part_path = dest.with_name(dest.name + ".part")
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
+
+        headers = {}
+        if resume_from:
+            logger.debug(f"Resuming download of {url} at byte {resume_from}")
+            headers["Range"] = f"bytes={resume_from}-"
+
+        try:
+            with requests.get(
+                url, stream=True, headers=headers, timeout=60
+            ) as response:
+                if resume_from and response.status_code != 206:
+                    # Server ignored the range request; start over
+                    resume_from = 0
+                response.raise_for_status()
+
+                with part_path.open("ab" if resume_from else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+        except requests.RequestException as e:
+            logger.warning(f"Download failed for {url}: {e}")
+            return False
+
+        os.replace(part_path, dest)
+        return True
+
+    @staticmethod
+    def _find_cached_deb(directory: Path, package_name: str) -> Optional[Path]:
+        """
+        Look up a previously downloaded .deb for a package.
+
+        Matches the Debian name_version_arch.deb convention so package
+        names that prefix other package names don't collide.
+
+        Args:
+            directory: Cache directory to search
+            package_name: Debian package name
+
+        Returns:
+            Newest matching .deb, or None
+        """
+        match = _deb_pattern(package_name).match
+        try:
+            with os.scandir(directory) as entries:
+                matches = [entry.name for entry in entries if match(entry.name)]
+        except OSError:
+            return None
+        return directory / max(matches) if matches else None
+
+    @staticmethod
+    def _seed_shared_cache(deb_path: Path) -> None:
+        """
+        Store a freshly downloaded .deb in the shared cache.
+
+        Args:
+            deb_path: Downloaded package file
+        """
+        try:
+            SHARED_DEB_CACHE.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(deb_path, SHARED_DEB_CACHE / deb_path.name)
+        except OSError as e:
+            # Best-effort; the build still has its local copy
+            logger.debug(f"Could not seed shared deb cache: {e}")
 
     def extract_firmware(self, package_path: Path, dest_dir: Path) -> None:
         """
@@ -288,25 +601,109 @@ class FirmwareManager:
         ):
             dest_dir.mkdir(parents=True, exist_ok=True)
 
+            # Prefer in-process extraction of just the firmware payload;
+            # dpkg-deb -x unpacks the entire data tarball including docs
+            # and changelogs, often more than half of a firmware .deb
+            if self._extract_firmware_payload(package_path, dest_dir):
+                logger.info(f"Extracted {package_path} to {dest_dir}")
+                return
+
             try:
                 # Extract .deb package using dpkg-deb
-                subprocess.run(
-                    ["dpkg-deb", "-x", str(package_path), str(dest_dir)],
-                    check=True,
-                    capture_output=True,
-                )
+                _run_quiet(["dpkg-deb", "-x", str(package_path), str(dest_dir)])
                 logger.info(f"Extracted {package_path} to {dest_dir}")
             except subprocess.CalledProcessError as e:
                 raise FirmwareIntegrationError(
                     f"Failed to extract {package_path}: {e.stderr}"
                 )
 
+    # Only these trees inside a package are ever integrated into the ISO
+    FIRMWARE_MEMBER_PREFIXES = ("./lib/firmware/", "./usr/lib/firmware/")
+
+    def _extract_firmware_payload(self, package_path: Path, dest_dir: Path) -> bool:
+        """
+        Extract a package's firmware trees in-process with python-debian.
+
+        Streams the data tarball without forking dpkg-deb and writes only
+        the lib/firmware and usr/lib/firmware members, skipping docs and
+        changelogs entirely.
+
+        Args:
+            package_path: Path to .deb package
+            dest_dir: Destination directory for extracted files
+
+        Returns:
+            True on success, False to fall back to dpkg-deb
+        """
+        if debfile is None:
+            return False
+
+        try:
+            data_tar = debfile.DebFile(str(package_path)).data.tgz()
+            members = [
+                member
+                for member in data_tar
+                if member.name.startswith(self.FIRMWARE_MEMBER_PREFIXES)
+            ]
+            data_tar.extractall(path=dest_dir, members=members, filter="data")
+            return True
+        except Exception as e:
+            # Unsupported compression or malformed archive; dpkg-deb is
+            # the reference implementation, let it try
+            logger.debug(f"In-process extraction failed for {package_path}: {e}")
+            return False
+
+    def _stream_package_firmware(
+        self, package_path: Path, firmware_dir: Path
+    ) -> Optional[int]:
+        """
+        Stream a package's firmware members directly into the ISO tree.
+
+        Members are renamed on the fly to drop the lib/firmware or
+        usr/lib/firmware prefix, so the tarball is unpacked once into
+        its final location with no staging directory in between.
+
+        Args:
+            package_path: Path to .deb package
+            firmware_dir: Firmware directory inside the ISO root
+
+        Returns:
+            Number of files written, or None to fall back to staged
+            extraction
+        """
+        if debfile is None:
+            return None
+
+        try:
+            data_tar = debfile.DebFile(str(package_path)).data.tgz()
+            members = []
+            copied = 0
+            for member in data_tar:
+                for prefix in self.FIRMWARE_MEMBER_PREFIXES:
+                    if member.name.startswith(prefix):
+                        stripped = member.name[len(prefix) :]
+                        if stripped:
+                            member.name = stripped
+                            members.append(member)
+                            if member.isfile():
+                                copied += 1
+                        break
+            data_tar.extractall(path=firmware_dir, members=members, filter="data")
+            return copied
+        except Exception as e:
+            logger.debug(f"Streamed integration failed for {package_path}: {e}")
+            return None
+
     def verify_checksum(
         self, file_path: Path, expected_hash: str, hash_type: str = "sha256"
     ) -> bool:
         """
         Verify file checksum.
 
+        Digests are memoized in a sidecar keyed on (path, size,
+        mtime_ns), so re-verifying an unchanged cached .deb on the next
+        build skips rehashing hundreds of megabytes.
+
         Args:
             file_path: Path to file to verify
             expected_hash: Expected hash value
@@ -314,20 +711,53 @@ class FirmwareManager:
 
         Returns:
             True if checksum matches, False otherwise
+
+        Raises:
+            ValueError: If the hash algorithm is not available
         """
-        if hash_type == "sha256":
-            hasher = hashlib.sha256()
-        elif hash_type == "md5":
-            hasher = hashlib.md5()
-        else:
+        try:
+            hashlib.new(hash_type)
+        except ValueError:
             raise ValueError(f"Unsupported hash type: {hash_type}")
 
-        with file_path.open("rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
+        st = file_path.stat()
+        key = f"{file_path}|{st.st_size}|{st.st_mtime_ns}|{hash_type}"
+        actual_hash = self._hash_cache.get(key)
+
+        if actual_hash is None:
+            # file_digest streams at C speed with a large internal buffer
+            # and releases the GIL, instead of an 8 KiB Python-level read
+            # loop with a hasher.update call per chunk
+            with file_path.open("rb") as f:
+                actual_hash = hashlib.file_digest(f, hash_type).hexdigest()
+            with self._hash_lock:
+                self._hash_cache[key] = actual_hash
+                self._save_hash_cache()
 
-        actual_hash = hasher.hexdigest()
-        return actual_hash == expected_hash
+        return actual_hash == expected_hash.lower()
+
+    def _load_hash_cache(self) -> Dict[str, str]:
+        """
+        Load the persisted digest cache.
+
+        Returns:
+            Mapping of path|size|mtime_ns|algorithm keys to hex digests
+        """
+        try:
+            cache: Dict[str, str] = _json_loads(self._hash_cache_path.read_bytes())
+            return cache
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hash_cache(self) -> None:
+        """Persist the digest cache atomically (best-effort)."""
+        tmp_path = self._hash_cache_path.with_name(f".hashes.json.tmp{os.getpid()}")
+        try:
+            tmp_path.write_text(json.dumps(self._hash_cache))
+            os.replace(tmp_path, self._hash_cache_path)
+        except OSError as e:
+            logger.debug(f"Could not persist hash cache: {e}")
+            tmp_path.unlink(missing_ok=True)
 
     def integrate_firmware(self, firmware_files: List[Path], iso_root: Path) -> None:
         """
@@ -342,63 +772,124 @@ class FirmwareManager:
         """
         with track_performance("integrate_all_firmware", stage="firmware_integration"):
             firmware_dir = iso_root / "firmware"
-            # Use sudo to create firmware directory (ISO root may be owned by root)
-            subprocess.run(
-                ["sudo", "mkdir", "-p", str(firmware_dir)],
-                check=True,
-                capture_output=True,
-            )
-
-            for package_path in firmware_files:
-                try:
-                    with track_performance(
-                        f"integrate_{package_path.stem}", stage="firmware_integration"
-                    ):
-                        # Extract to temporary directory
-                        temp_extract = self.cache_dir / "temp_extract"
-                        temp_extract.mkdir(exist_ok=True)
-
-                        self.extract_firmware(package_path, temp_extract)
-
-                        # Copy firmware files to ISO
-                        # Check both /lib/firmware and /usr/lib/firmware paths
-                        # Modern Debian packages use /usr/lib/firmware
-                        firmware_paths = [
-                            temp_extract / "lib" / "firmware",
-                            temp_extract / "usr" / "lib" / "firmware",
-                        ]
-
-                        for lib_firmware in firmware_paths:
-                            if lib_firmware.exists():
-                                for item in lib_firmware.rglob("*"):
-                                    if item.is_file():
-                                        rel_path = item.relative_to(lib_firmware)
-                                        dest = firmware_dir / rel_path
-                                        # Use sudo to create parent dir and copy
-                                        subprocess.run(
-                                            [
-                                                "sudo",
-                                                "mkdir",
-                                                "-p",
-                                                str(dest.parent),
-                                            ],
-                                            check=True,
-                                            capture_output=True,
-                                        )
-                                        subprocess.run(
-                                            ["sudo", "cp", "-p", str(item), str(dest)],
-                                            check=True,
-                                            capture_output=True,
-                                        )
-                                        logger.debug(f"Copied firmware: {rel_path}")
-
-                        # Clean up
-                        shutil.rmtree(temp_extract, ignore_errors=True)
-
-                except Exception as e:
-                    logger.error(f"Failed to integrate {package_path}: {e}")
-                    raise FirmwareIntegrationError(f"Firmware integration failed: {e}")
+            # The extracted tree is owned by the build user (userspace
+            # extraction), so no privilege escalation is needed here
+            firmware_dir.mkdir(parents=True, exist_ok=True)
+
+            # Packages are independent, so extract and copy them in
+            # parallel, each through its own staging directory
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    executor.submit(
+                        self._integrate_package, package_path, firmware_dir
+                    ): package_path
+                    for package_path in firmware_files
+                }
+                for future in as_completed(futures):
+                    package_path = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to integrate {package_path}: {e}")
+                        raise FirmwareIntegrationError(
+                            f"Firmware integration failed: {e}"
+                        )
 
             logger.info(
                 f"Successfully integrated {len(firmware_files)} firmware packages"
             )
+
+    def _integrate_package(self, package_path: Path, firmware_dir: Path) -> None:
+        """
+        Extract a single firmware package and copy its files into the ISO.
+
+        Args:
+            package_path: Path to the .deb package
+            firmware_dir: Firmware directory inside the ISO root
+
+        Raises:
+            FirmwareIntegrationError: If extraction fails
+        """
+        with track_performance(
+            f"integrate_{package_path.stem}", stage="firmware_integration"
+        ):
+            # Fast path: stream the firmware members straight into the
+            # ISO tree with their lib/firmware prefix stripped, so each
+            # byte is written to disk exactly once and no staging
+            # directory is materialized or torn down
+            copied = self._stream_package_firmware(package_path, firmware_dir)
+            if copied is not None:
+                logger.info(
+                    f"Integrated {copied} firmware files from {package_path.name}"
+                )
+                return
+
+            # Per-package staging directory so packages can be
+            # processed concurrently
+            temp_extract = self.cache_dir / f"temp_extract_{package_path.stem}"
+            temp_extract.mkdir(exist_ok=True)
+
+            try:
+                self.extract_firmware(package_path, temp_extract)
+
+                # Copy firmware files to ISO
+                # Check both /lib/firmware and /usr/lib/firmware paths
+                # Modern Debian packages use /usr/lib/firmware
+                firmware_paths = [
+                    temp_extract / "lib" / "firmware",
+                    temp_extract / "usr" / "lib" / "firmware",
+                ]
+
+                # Per-file messages are gated so thousands of log records
+                # (and their f-string formatting) are skipped entirely
+                # unless debug logging is on
+                log_files = logger.isEnabledFor(logging.DEBUG)
+                copied = 0
+
+                # os.walk gives filenames per directory from one scandir
+                # pass (no stat per entry for globbing plus another for
+                # is_file) and plain strings avoid a Path allocation per
+                # firmware file; directories are created once each
+                firmware_dest = str(firmware_dir)
+                made_dirs = {firmware_dest}
+
+                # One st_dev comparison decides the transfer strategy for
+                # the whole package: when staging and ISO tree live on
+                # different filesystems every hardlink attempt would fail
+                # with EXDEV, so go straight to copying
+                same_device = (
+                    os.stat(temp_extract).st_dev == os.stat(firmware_dest).st_dev
+                )
+                transfer = _link_or_copy if same_device else shutil.copy2
+
+                for lib_firmware in firmware_paths:
+                    root = str(lib_firmware)
+                    for dirpath, _, filenames in os.walk(root):
+                        rel_dir = os.path.relpath(dirpath, root)
+                        dest_dir = (
+                            firmware_dest
+                            if rel_dir == "."
+                            else os.path.join(firmware_dest, rel_dir)
+                        )
+                        if dest_dir not in made_dirs:
+                            os.makedirs(dest_dir, exist_ok=True)
+                            made_dirs.add(dest_dir)
+
+                        for filename in filenames:
+                            # Hardlinks are metadata-only moves; xorriso
+                            # dereferences them when building the image,
+                            # so semantics are unchanged
+                            transfer(
+                                os.path.join(dirpath, filename),
+                                os.path.join(dest_dir, filename),
+                            )
+                            copied += 1
+                            if log_files:
+                                logger.debug(f"Copied firmware: {filename}")
+
+                logger.info(
+                    f"Integrated {copied} firmware files from {package_path.name}"
+                )
+            finally:
+                # Clean up
+                shutil.rmtree(temp_extract, ignore_errors=True)
@@ -1,10 +1,13 @@
 """Performance timing utilities for Proxmox ISO builder."""
 
 import logging
+import os
+import sys
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
@@ -12,28 +15,58 @@ from rich.table import Table
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (a meaningful share of a
+# record's footprint once thousands of operations are tracked) and
+# makes field access a fixed-offset load; kept a dataclass because
+# complete() mutates fields
+@dataclass(slots=True)
 class TimingRecord:
-    """Record of a single timed operation."""
+    """
+    Record of a single timed operation.
+
+    Timestamps are integer nanoseconds from time.perf_counter_ns:
+    monotonic (immune to NTP clock steps that would corrupt durations)
+    and free of float rounding; duration stays a seconds float for
+    display.
+    """
 
     name: str
     stage: str
-    start_time: float
-    end_time: Optional[float] = None
+    start_time: int
+    end_time: Optional[int] = None
     duration: Optional[float] = None
 
-    def complete(self) -> None:
-        """Mark the timing record as complete."""
-        self.end_time = time.time()
-        self.duration = self.end_time - self.start_time
+    def complete(self) -> float:
+        """
+        Mark the timing record as complete.
+
+        Returns:
+            Duration of the operation in seconds
+        """
+        self.end_time = time.perf_counter_ns()
+        self.duration = (self.end_time - self.start_time) / 1e9
+        return self.duration
+
+
+# Shared record yielded by disabled trackers so the no-op path
+# allocates nothing per tracked operation
+_NULL_RECORD = TimingRecord(name="", stage="", start_time=0)
 
 
 @dataclass
 class PerformanceTracker:
     """Track and report performance metrics for build stages and actions."""
 
+    # When False, track() is a no-op yielding a shared dummy record;
+    # no timer dict traffic, no record append, no [PERF] log line
+    enabled: bool = True
     records: List[TimingRecord] = field(default_factory=list)
-    _active_timers: Dict[str, TimingRecord] = field(default_factory=dict)
+    # Keyed by (stage, name) tuples: hashing a tuple of existing strings
+    # is cheaper than building a concatenated key string per start/stop
+    _active_timers: Dict[Tuple[str, str], TimingRecord] = field(default_factory=dict)
+    # Running per-stage totals, maintained in stop_timer so the stage
+    # summary never needs a sweep over all records
+    _stage_totals: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
 
     def start_timer(self, name: str, stage: str = "default") -> TimingRecord:
         """
@@ -46,13 +79,17 @@ class PerformanceTracker:
         Returns:
             TimingRecord for the started timer
         """
+        # The same stage/operation names recur across thousands of
+        # records; interning shares one string object per distinct name
+        # and lets dict key comparisons hit the identity fast path
+        name = sys.intern(name)
+        stage = sys.intern(stage)
         record = TimingRecord(
             name=name,
             stage=stage,
-            start_time=time.time(),
+            start_time=time.perf_counter_ns(),
         )
-        key = f"{stage}:{name}"
-        self._active_timers[key] = record
+        self._active_timers[(stage, name)] = record
         logger.debug(f"Started timer for {name} in stage {stage}")
         return record
 
@@ -67,12 +104,14 @@ class PerformanceTracker:
         Returns:
             Completed TimingRecord or None if timer not found
         """
-        key = f"{stage}:{name}"
-        record = self._active_timers.pop(key, None)
+        record = self._active_timers.pop((stage, name), None)
         if record:
-            record.complete()
+            duration = record.complete()
             self.records.append(record)
-            logger.info(f"[PERF] {record.stage}/{record.name}: {record.duration:.2f}s")
+            self._stage_totals[record.stage] += duration
+            # Skip building the message when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"[PERF] {record.stage}/{record.name}: {duration:.2f}s")
         return record
 
     @contextmanager
@@ -89,6 +128,9 @@ class PerformanceTracker:
         Yields:
             TimingRecord for the operation
         """
+        if not self.enabled:
+            yield _NULL_RECORD
+            return
         record = self.start_timer(name, stage)
         try:
             yield record
@@ -102,13 +144,8 @@ class PerformanceTracker:
         Returns:
             Dictionary mapping stage names to total duration in seconds
         """
-        summary: Dict[str, float] = {}
-        for record in self.records:
-            if record.duration is not None:
-                if record.stage not in summary:
-                    summary[record.stage] = 0.0
-                summary[record.stage] += record.duration
-        return summary
+        # Totals are accumulated as timers stop; no sweep over records
+        return dict(self._stage_totals)
 
     def get_total_time(self) -> float:
         """
@@ -117,9 +154,8 @@ class PerformanceTracker:
         Returns:
             Total duration in seconds
         """
-        return sum(
-            record.duration for record in self.records if record.duration is not None
-        )
+        # Equivalent to summing completed records, without the scan
+        return sum(self._stage_totals.values())
 
     def format_duration(self, seconds: float) -> str:
         """
@@ -157,38 +193,39 @@ class PerformanceTracker:
             console.print("[yellow]No performance data recorded[/yellow]")
             return
 
+        # One pass over the records; stage totals and the grand total
+        # come from the running accumulator, not further scans
+        format_duration = self.format_duration
+        rows = [
+            (record.stage, record.name, format_duration(record.duration))
+            for record in self.records
+            if record.duration is not None
+        ]
+
         # Create detailed timing table
         table = Table(title="Performance Summary")
         table.add_column("Stage", style="cyan")
         table.add_column("Operation", style="green")
         table.add_column("Duration", style="yellow", justify="right")
-
-        for record in self.records:
-            if record.duration is not None:
-                table.add_row(
-                    record.stage,
-                    record.name,
-                    self.format_duration(record.duration),
-                )
-
+        for row in rows:
+            table.add_row(*row)
         console.print(table)
 
         # Print stage summary
-        stage_summary = self.get_stage_summary()
-        if stage_summary:
+        if self._stage_totals:
             summary_table = Table(title="Stage Summary")
             summary_table.add_column("Stage", style="cyan")
             summary_table.add_column("Total Time", style="yellow", justify="right")
 
             for stage, duration in sorted(
-                stage_summary.items(), key=lambda x: x[1], reverse=True
+                self._stage_totals.items(), key=lambda x: x[1], reverse=True
             ):
-                summary_table.add_row(stage, self.format_duration(duration))
+                summary_table.add_row(stage, format_duration(duration))
 
             console.print(summary_table)
 
         # Print total time
-        total = self.get_total_time()
+        total = sum(self._stage_totals.values())
         console.print(f"\n[bold]Total Build Time: {self.format_duration(total)}[/bold]")
 
     def to_dict(self) -> Dict:
@@ -222,12 +259,20 @@ def get_performance_tracker() -> PerformanceTracker:
     """
     Get the global performance tracker instance.
 
+    Tracking can be switched off for a run by setting the
+    PROXMOX_ISO_PERF environment variable to 0/false/no.
+
     Returns:
         Global PerformanceTracker instance
     """
     global _global_tracker
     if _global_tracker is None:
-        _global_tracker = PerformanceTracker()
+        enabled = os.environ.get("PROXMOX_ISO_PERF", "1").lower() not in (
+            "0",
+            "false",
+            "no",
+        )
+        _global_tracker = PerformanceTracker(enabled=enabled)
     return _global_tracker
 
 